@@ -1,7 +1,6 @@
 #include "hash_utils.h"
 #include <openssl/sha.h>
 #include <openssl/evp.h>
-#include <cstring>
 #include <memory>
 
 namespace anoverif
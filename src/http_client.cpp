@@ -1,7 +1,6 @@
 #include "http_client.h"
 #include <curl/curl.h>
 #include <stdexcept>
-#include <memory>
 
 namespace anoverif
 {
@@ -20,23 +20,35 @@ namespace anoverif
         std::atomic<int> true_responses_;
         std::atomic<int> false_responses_;
 
+        // Request headers are identical for every request, so build them once
+        struct curl_slist *headers_;
+
     public:
         TestClient(const std::string &server_url)
             : server_url_(server_url), successful_requests_(0), failed_requests_(0),
-              true_responses_(0), false_responses_(0) {}
+              true_responses_(0), false_responses_(0), headers_(nullptr)
+        {
+            headers_ = curl_slist_append(headers_, "Content-Type: application/json");
+        }
 
+        ~TestClient()
+        {
+            curl_slist_free_all(headers_);
+        }
+
+        // Members ordered largest-first to avoid padding (48 bytes instead of 56)
         struct Response
         {
-            int status_code;
             std::string body;
+            double response_time_ms;
+            int status_code;
             bool success;
-            long response_time_ms;
         };
 
         Response send_request(const std::string &idval)
         {
             CURL *curl = curl_easy_init();
-            Response response{0, "", false, 0};
+            Response response{"", 0, 0, false};
 
             if (!curl)
             {
@@ -44,12 +56,8 @@ namespace anoverif
                 return response;
             }
 
-            // Prepare JSON payload
-            Json::Value payload;
-            payload["idval"] = idval;
-
-            Json::StreamWriterBuilder builder;
-            std::string json_data = Json::writeString(builder, payload);
+            // Prepare JSON payload (only idval varies, so skip Json::Value and the writer)
+            std::string json_data = "{\"idval\":" + Json::valueToQuotedString(idval.c_str()) + "}";
 
             // Setup CURL options
             curl_easy_setopt(curl, CURLOPT_URL, server_url_.c_str());
@@ -59,30 +67,32 @@ namespace anoverif
             curl_easy_setopt(curl, CURLOPT_WRITEDATA, &response.body);
             curl_easy_setopt(curl, CURLOPT_TIMEOUT, 10L);
 
+            // Disable Nagle so small JSON POSTs are not delayed on the wire
+            curl_easy_setopt(curl, CURLOPT_TCP_NODELAY, 1L);
+
             // Set headers
-            struct curl_slist *headers = nullptr;
-            headers = curl_slist_append(headers, "Content-Type: application/json");
-            curl_easy_setopt(curl, CURLOPT_HTTPHEADER, headers);
+            curl_easy_setopt(curl, CURLOPT_HTTPHEADER, headers_);
 
             // Record start time
-            auto start_time = std::chrono::high_resolution_clock::now();
+            auto start_time = std::chrono::steady_clock::now();
 
             // Perform request
             CURLcode res = curl_easy_perform(curl);
 
             // Calculate response time
-            auto end_time = std::chrono::high_resolution_clock::now();
-            response.response_time_ms = std::chrono::duration_cast<std::chrono::milliseconds>(
+            auto end_time = std::chrono::steady_clock::now();
+            response.response_time_ms = std::chrono::duration<double, std::milli>(
                                             end_time - start_time)
                                             .count();
 
             if (res == CURLE_OK)
             {
-                curl_easy_getinfo(curl, CURLINFO_RESPONSE_CODE, &response.status_code);
+                long status_code = 0;
+                curl_easy_getinfo(curl, CURLINFO_RESPONSE_CODE, &status_code);
+                response.status_code = static_cast<int>(status_code);
                 response.success = (response.status_code >= 200 && response.status_code < 300);
             }
 
-            curl_slist_free_all(headers);
             curl_easy_cleanup(curl);
 
             return response;
@@ -151,30 +161,43 @@ namespace anoverif
             true_responses_ = 0;
             false_responses_ = 0;
 
-            auto start_time = std::chrono::high_resolution_clock::now();
+            // Pre-generate test ids so RNG and string formatting stay off the timed path
+            std::vector<std::string> test_ids;
+            test_ids.reserve(num_requests);
+            {
+                std::random_device rd;
+                std::mt19937 gen(rd());
+                std::uniform_int_distribution<> dis(1000000, 9999999);
+
+                for (int i = 0; i < num_requests; i++)
+                {
+                    test_ids.push_back("user_" + std::to_string(dis(gen)));
+                }
+            }
+
+            auto start_time = std::chrono::steady_clock::now();
 
             std::vector<std::thread> threads;
+            threads.reserve(concurrency);
             std::atomic<int> requests_sent(0);
 
             for (int i = 0; i < concurrency; i++)
             {
-                threads.emplace_back([this, &requests_sent, num_requests]()
+                threads.emplace_back([this, &requests_sent, &test_ids, num_requests]()
                                      {
-                std::random_device rd;
-                std::mt19937 gen(rd());
-                std::uniform_int_distribution<> dis(1000000, 9999999);
-                
-                while (requests_sent++ < num_requests) {
-                    std::string test_id = "user_" + std::to_string(dis(gen));
-                    auto response = send_request(test_id);
+                // One reader per worker instead of one per response
+                Json::Reader reader;
+                Json::Value root;
+
+                int index;
+                while ((index = requests_sent++) < num_requests) {
+                    auto response = send_request(test_ids[index]);
                     
                     if (response.success) {
                         successful_requests_++;
                         
                         // Parse response to count true/false
-                        Json::Value root;
-                        Json::Reader reader;
-                        if (reader.parse(response.body, root)) {
+                        if (reader.parse(response.body, root, false)) {
                             bool result = root.get("result", false).asBool();
                             if (result) {
                                 true_responses_++;
@@ -194,7 +217,7 @@ namespace anoverif
                 thread.join();
             }
 
-            auto end_time = std::chrono::high_resolution_clock::now();
+            auto end_time = std::chrono::steady_clock::now();
             auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(
                 end_time - start_time);
 